@@ -96,6 +96,9 @@ class ExtendedClient(BaseExchangeClient):
         # For websocket
         self._stop_event = asyncio.Event()
         self._tasks: list[asyncio.Task] = []
+
+        # Shared HTTP session for REST calls, created on first use so connections are kept alive
+        self._http_session: Optional[aiohttp.ClientSession] = None
         
         # Maintain open order dict because there is a delay in the official Rest API
         self.open_orders = {} # {order_id: order_info}
@@ -104,6 +107,14 @@ class ExtendedClient(BaseExchangeClient):
         self.initial_check_for_open_orders = True  # PATCH: will turn to False after 2 times (to match the trading bot logic), so that we can get the open orders even after restarting the script
         self.get_active_orders_cnt = 0
 
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it if needed."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75, ttl_dns_cache=300)
+            )
+        return self._http_session
+
     def _validate_config(self) -> None:
         """Validate the exchange-specific configuration."""
         required_env_vars = ['EXTENDED_VAULT', 'EXTENDED_STARK_KEY_PRIVATE', 'EXTENDED_STARK_KEY_PUBLIC', 'EXTENDED_API_KEY']
@@ -171,7 +182,14 @@ class ExtendedClient(BaseExchangeClient):
             self.logger.log(f"Error during Extended disconnect: {e}", "ERROR")
             self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
             raise
-        
+        finally:
+            await self.close_http_session()
+
+    async def close_http_session(self) -> None:
+        """Close the shared HTTP session used for REST calls, if it is open."""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
         
     async def fetch_bbo_prices(self, contract_id: str) -> tuple[Decimal, Decimal]:
         """Fetch best bid and offer prices from orderbook."""
@@ -473,43 +491,43 @@ class ExtendedClient(BaseExchangeClient):
         while not order_info and attempt < 50:
             attempt += 1
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, headers=headers) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            
-                            if data.get("status") != "OK" or not data.get("data"):
-                                self.logger.log(f"Failed to get order info attempt {attempt} for {order_id}: {data}", "ERROR")
-                                return None
-                            
-                            order_data = data["data"]
-                            
-                            # Convert status to match expected format
-                            status = order_data.get("status", "")
-                            if status == "NEW":
-                                status = "OPEN"
-                            elif status == "CANCELLED":
-                                status = "CANCELED"
-                            
-                            # Create OrderInfo object
-                            order_info = OrderInfo(
-                                order_id=str(order_data.get("id", "")),
-                                side=order_data.get("side", "").lower(),
-                                size=Decimal(order_data.get("qty", "0")) - Decimal(order_data.get("filledQty", "0")),
-                                price=Decimal(order_data.get("price", "0")),
-                                status=status,
-                                filled_size=Decimal(order_data.get("filledQty", "0")),
-                                remaining_size=Decimal(order_data.get("qty", "0")) - Decimal(order_data.get("filledQty", "0"))
-                            )
-                            return order_info
+                session = self._get_http_session()
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 200:
+                        data = await response.json()
                         
-                        elif response.status == 404:
-                            # Order not found
-                            self.logger.log(f"Order {order_id} not found attempt {attempt}", "INFO")
+                        if data.get("status") != "OK" or not data.get("data"):
+                            self.logger.log(f"Failed to get order info attempt {attempt} for {order_id}: {data}", "ERROR")
+                            return None
+                        
+                        order_data = data["data"]
+                        
+                        # Convert status to match expected format
+                        status = order_data.get("status", "")
+                        if status == "NEW":
+                            status = "OPEN"
+                        elif status == "CANCELLED":
+                            status = "CANCELED"
+                        
+                        # Create OrderInfo object
+                        order_info = OrderInfo(
+                            order_id=str(order_data.get("id", "")),
+                            side=order_data.get("side", "").lower(),
+                            size=Decimal(order_data.get("qty", "0")) - Decimal(order_data.get("filledQty", "0")),
+                            price=Decimal(order_data.get("price", "0")),
+                            status=status,
+                            filled_size=Decimal(order_data.get("filledQty", "0")),
+                            remaining_size=Decimal(order_data.get("qty", "0")) - Decimal(order_data.get("filledQty", "0"))
+                        )
+                        return order_info
+                    
+                    elif response.status == 404:
+                        # Order not found
+                        self.logger.log(f"Order {order_id} not found attempt {attempt}", "INFO")
+                    
+                    else:
+                        self.logger.log(f"Failed to get order info attempt {attempt} for {order_id}: HTTP {response.status}", "ERROR")
                         
-                        else:
-                            self.logger.log(f"Failed to get order info attempt {attempt} for {order_id}: HTTP {response.status}", "ERROR")
-                            
             except Exception as e:
                 self.logger.log(f"Error getting order info attempt {attempt} for {order_id}: {str(e)}", "ERROR")
             
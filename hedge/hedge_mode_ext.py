@@ -22,6 +22,12 @@ import websockets
 from datetime import datetime
 import pytz
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 
 class Config:
     """Simple config class to wrap dictionary for Extended client."""
@@ -33,6 +39,17 @@ class Config:
 class HedgeBot:
     """Trading bot that places post-only orders on Extended and hedges with market orders on Lighter."""
 
+    # Non-filled Extended order statuses as tracked by the order monitor (partial fills keep the order open)
+    EXTENDED_ORDER_STATUS_MAP = {
+        'PARTIALLY_FILLED': 'OPEN',
+        'CANCELED': 'CANCELED',
+        'CANCELLED': 'CANCELLED',
+        'NEW': 'NEW',
+        'OPEN': 'OPEN',
+        'PENDING': 'PENDING',
+        'CANCELING': 'CANCELING',
+    }
+
     def __init__(self, ticker: str, order_quantity: Decimal, fill_timeout: int = 5, iterations: int = 20, sleep_time: int = 0):
         self.ticker = ticker
         self.order_quantity = order_quantity
@@ -53,6 +70,10 @@ class HedgeBot:
         # Initialize CSV file with headers if it doesn't exist
         self._initialize_csv_file()
 
+        # Trade rows are written by a background task so websocket handlers never touch the file
+        self.csv_queue = asyncio.Queue()
+        self.csv_writer_task = None
+
         # Setup logger
         self.logger = logging.getLogger(f"hedge_bot_{ticker}")
         self.logger.setLevel(logging.INFO)
@@ -89,6 +110,7 @@ class HedgeBot:
 
         # State management
         self.stop_flag = False
+        self.stop_event = asyncio.Event()
         self.order_counter = 0
 
         # Extended state
@@ -96,12 +118,17 @@ class HedgeBot:
         self.extended_contract_id = None
         self.extended_tick_size = None
         self.extended_order_status = None
+        self.extended_order_status_event = asyncio.Event()
+        self.pending_cancel_tasks = {}  # {order_id: cancel task}
 
         # Extended order book state for websocket-based BBO
         self.extended_order_book = {'bids': {}, 'asks': {}}
         self.extended_best_bid = None
         self.extended_best_ask = None
         self.extended_order_book_ready = False
+        self.extended_order_book_ready_event = asyncio.Event()
+        self.extended_order_book_resync = False
+        self._extended_decimal_cache = {}
 
         # Lighter order book state
         self.lighter_client = None
@@ -109,6 +136,7 @@ class HedgeBot:
         self.lighter_best_bid = None
         self.lighter_best_ask = None
         self.lighter_order_book_ready = False
+        self.lighter_order_book_ready_event = asyncio.Event()
         self.lighter_order_book_offset = 0
         self.lighter_order_book_sequence_gap = False
         self.lighter_snapshot_loaded = False
@@ -148,10 +176,14 @@ class HedgeBot:
         self.extended_stark_key_private = os.getenv('EXTENDED_STARK_KEY_PRIVATE')
         self.extended_stark_key_public = os.getenv('EXTENDED_STARK_KEY_PUBLIC')
         self.extended_api_key = os.getenv('EXTENDED_API_KEY')
+        self.extended_market_name = f"{ticker}-USD"  # Extended uses format like BTC-USD
+        self.extended_depth_ws_url = ("wss://api.starknet.extended.exchange/stream.extended.exchange/v1/orderbooks/"
+                                      f"{self.extended_market_name}?depth=1")
 
     def shutdown(self, signum=None, frame=None):
         """Graceful shutdown handler."""
         self.stop_flag = True
+        self.stop_event.set()
         self.logger.info("\n🛑 Stopping...")
 
         # Close WebSocket connections
@@ -186,22 +218,47 @@ class HedgeBot:
                 writer = csv.writer(csvfile)
                 writer.writerow(['exchange', 'timestamp', 'side', 'price', 'quantity'])
 
+    def _write_csv_rows(self, rows: list):
+        """Append trade rows to the CSV file."""
+        with open(self.csv_filename, 'a', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerows(rows)
+
     def log_trade_to_csv(self, exchange: str, side: str, price: str, quantity: str):
         """Log trade details to CSV file."""
         timestamp = datetime.now(pytz.UTC).isoformat()
+        row = [exchange, timestamp, side, price, quantity]
 
-        with open(self.csv_filename, 'a', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([
-                exchange,
-                timestamp,
-                side,
-                price,
-                quantity
-            ])
+        if self.csv_writer_task and not self.csv_writer_task.done():
+            self.csv_queue.put_nowait(row)
+        else:
+            self._write_csv_rows([row])
 
         self.logger.info(f"📊 Trade logged to CSV: {exchange} {side} {quantity} @ {price}")
 
+    async def csv_writer(self):
+        """Write queued trade rows to the CSV file, flushing once per batch."""
+        with open(self.csv_filename, 'a', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            while True:
+                rows = [await self.csv_queue.get()]
+                while not self.csv_queue.empty():
+                    rows.append(self.csv_queue.get_nowait())
+                writer.writerows(rows)
+                csvfile.flush()
+
+    async def stop_csv_writer(self):
+        """Stop the CSV writer task and write any rows still queued."""
+        if self.csv_writer_task and not self.csv_writer_task.done():
+            self.csv_writer_task.cancel()
+            await asyncio.gather(self.csv_writer_task, return_exceptions=True)
+
+        rows = []
+        while not self.csv_queue.empty():
+            rows.append(self.csv_queue.get_nowait())
+        if rows:
+            self._write_csv_rows(rows)
+
     def handle_lighter_order_result(self, order_data):
         """Handle Lighter order result from WebSocket."""
         try:
@@ -410,6 +467,7 @@ class HedgeBot:
                                     self.update_lighter_order_book("asks", asks)
                                     self.lighter_snapshot_loaded = True
                                     self.lighter_order_book_ready = True
+                                    self.lighter_order_book_ready_event.set()
 
                                     self.logger.info(f"✅ Lighter order book snapshot loaded with "
                                                      f"{len(self.lighter_order_book['bids'])} bids and "
@@ -497,8 +555,14 @@ class HedgeBot:
 
     def setup_signal_handlers(self):
         """Setup signal handlers for graceful shutdown."""
-        signal.signal(signal.SIGINT, self.shutdown)
-        signal.signal(signal.SIGTERM, self.shutdown)
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                # Run shutdown on the event loop so waiting tasks wake up immediately
+                loop.add_signal_handler(sig, self.shutdown, sig)
+            except NotImplementedError:
+                # Event loop signal handlers are not supported on Windows
+                signal.signal(sig, self.shutdown)
 
     def initialize_lighter_client(self):
         """Initialize the Lighter client."""
@@ -628,12 +692,31 @@ class HedgeBot:
         else:
             raise Exception(f"Failed to place order: {order_result.error_message}")
 
+    async def wait_for_extended_order_status(self, timeout: float):
+        """Wait for the next Extended order status update from WebSocket, up to timeout seconds."""
+        try:
+            await asyncio.wait_for(self.extended_order_status_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self.extended_order_status_event.clear()
+
+    async def cancel_extended_order(self, order_id: str):
+        """Cancel an Extended order and log the outcome."""
+        try:
+            cancel_result = await self.extended_client.cancel_order(order_id)
+            self.logger.info(f"cancel_result: {cancel_result}")
+            if not cancel_result.success:
+                self.logger.error(f"❌ Error canceling Extended order: {cancel_result.error_message}")
+        except Exception as e:
+            self.logger.error(f"❌ Error canceling Extended order: {e}")
+
     async def place_extended_post_only_order(self, side: str, quantity: Decimal):
         """Place a post-only order on Extended."""
         if not self.extended_client:
             raise Exception("Extended client not initialized")
 
         self.extended_order_status = None
+        self.extended_order_status_event.clear()
         self.logger.info(f"[OPEN] [Extended] [{side}] Placing Extended POST-ONLY order")
         order_id, order_price = await self.place_bbo_order(side, quantity)
 
@@ -647,9 +730,9 @@ class HedgeBot:
                 order_id, order_price = await self.place_bbo_order(side, quantity)
                 start_time = time.time()
                 last_cancel_time = 0  # Reset cancel timer
-                await asyncio.sleep(0.5)
+                await self.wait_for_extended_order_status(0.5)
             elif self.extended_order_status in ['NEW', 'OPEN', 'PENDING', 'CANCELING', 'PARTIALLY_FILLED']:
-                await asyncio.sleep(0.5)
+                await self.wait_for_extended_order_status(0.5)
                 
                 # Check if we need to cancel and replace the order
                 should_cancel = False
@@ -663,18 +746,16 @@ class HedgeBot:
                 # Cancel order if it's been too long or price is off
                 current_time = time.time()
                 if current_time - start_time > 10:
-                    if should_cancel and current_time - last_cancel_time > 5:  # Prevent rapid cancellations
-                        try:
-                            self.logger.info(f"Canceling order {order_id} due to timeout/price mismatch")
-                            cancel_result = await self.extended_client.cancel_order(order_id)
-                            self.logger.info(f"cancel_result: {cancel_result}")
-                            if cancel_result.success:
-                                last_cancel_time = current_time
-                                # Don't reset start_time here, let the cancellation trigger new order
-                            else:
-                                self.logger.error(f"❌ Error canceling Extended order: {cancel_result.error_message}")
-                        except Exception as e:
-                            self.logger.error(f"❌ Error canceling Extended order: {e}")
+                    # Prevent rapid cancellations and never send a second cancel while one is still in flight
+                    cancel_in_flight = order_id in self.pending_cancel_tasks
+                    if should_cancel and not cancel_in_flight and current_time - last_cancel_time > 5:
+                        self.logger.info(f"Canceling order {order_id} due to timeout/price mismatch")
+                        # Cancel in the background so the monitor keeps watching for a fill meanwhile;
+                        # don't reset start_time here, let the cancellation trigger new order
+                        last_cancel_time = current_time
+                        cancel_task = asyncio.create_task(self.cancel_extended_order(order_id))
+                        self.pending_cancel_tasks[order_id] = cancel_task
+                        cancel_task.add_done_callback(lambda _, oid=order_id: self.pending_cancel_tasks.pop(oid, None))
                     elif not should_cancel:
                         self.logger.info(f"Waiting for Extended order to be filled (order price is at best bid/ask)")
             elif self.extended_order_status == 'FILLED':
@@ -685,15 +766,120 @@ class HedgeBot:
                     self.logger.error(f"❌ Unknown Extended order status: {self.extended_order_status}")
                     break
                 else:
-                    await asyncio.sleep(0.5)
+                    await self.wait_for_extended_order_status(0.5)
+
+    def _to_decimal(self, value) -> Decimal:
+        """Convert a raw order book price/size to Decimal, reusing cached conversions."""
+        result = self._extended_decimal_cache.get(value)
+        if result is None:
+            if len(self._extended_decimal_cache) >= 10000:
+                self._extended_decimal_cache.clear()
+            result = self._extended_decimal_cache[value] = Decimal(value)
+        return result
+
+    def _apply_extended_levels(self, side: str, levels: list, best_price):
+        """Apply Extended order book levels to one side and return the new best price.
+
+        The best price is tracked incrementally so a tick only rescans the book
+        when the current best level is removed.
+        """
+        book = self.extended_order_book[side]
+        is_bid = side == 'bids'
+        last_best_price = best_price
+        to_decimal = self._to_decimal
+
+        # Levels in one message share a format, so check it once instead of per level
+        if levels and isinstance(levels[0], dict):
+            updates = {to_decimal(level.get('p', '0')): to_decimal(level.get('q', '0')) for level in levels}
+        else:
+            # Fallback for array format [price, size]
+            updates = {to_decimal(level[0]): to_decimal(level[1]) for level in levels}
+
+        added = {price: size for price, size in updates.items() if size > 0}
+        for price in updates.keys() - added.keys():
+            # Remove zero size orders
+            book.pop(price, None)
+        book.update(added)
+
+        if best_price not in book:
+            best_price = None
+        elif added:
+            best_added = max(added) if is_bid else min(added)
+            if best_added > best_price if is_bid else best_added < best_price:
+                best_price = best_added
+
+        if best_price is None:
+            if not book:
+                # Keep the last known best price while this side of the book is empty
+                return last_best_price
+            best_price = max(book) if is_bid else min(book)
+        return best_price
+
+    def coalesce_extended_depth_messages(self, messages: list) -> dict:
+        """Collapse queued Extended depth messages into one update, keeping the latest level per price."""
+        message_type = "DELTA"
+        levels = {'b': {}, 'a': {}}
+        for message in messages:
+            if message.get("type") == "SNAPSHOT":
+                # A snapshot supersedes everything queued before it
+                message_type = "SNAPSHOT"
+                levels['b'].clear()
+                levels['a'].clear()
+
+            data = message.get("data") or {}
+            for key, merged in levels.items():
+                for level in data.get(key, []):
+                    price = level.get('p', '0') if isinstance(level, dict) else level[0]
+                    merged[self._to_decimal(price)] = level
+
+        return {"type": message_type, "data": {key: list(merged.values()) for key, merged in levels.items()}}
+
+    async def process_extended_depth_queue(self, depth_queue: asyncio.Queue):
+        """Apply queued Extended depth messages, draining any backlog into a single update."""
+        while not self.stop_flag:
+            messages = [await depth_queue.get()]
+            while not depth_queue.empty():
+                messages.append(depth_queue.get_nowait())
+
+            try:
+                updates = []
+                for message in messages:
+                    try:
+                        data = json_loads(message)
+                    except json.JSONDecodeError as e:
+                        self.logger.warning(f"Failed to parse Extended order book message: {e}")
+                        continue
+
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("Received Extended order book message: %s", data)
+
+                    # Handle order book updates
+                    if data.get("type") in ["SNAPSHOT", "DELTA"]:
+                        updates.append(data)
+
+                if updates and self.extended_order_book_resync:
+                    # Frames were dropped, so deltas can't be applied until a snapshot arrives
+                    snapshot_indexes = [i for i, update in enumerate(updates) if update.get("type") == "SNAPSHOT"]
+                    if snapshot_indexes:
+                        updates = updates[snapshot_indexes[-1]:]
+                        self.extended_order_book_resync = False
+                    else:
+                        updates = []
+
+                if updates:
+                    self.handle_extended_order_book_update(self.coalesce_extended_depth_messages(updates))
+
+            except Exception as e:
+                self.logger.error(f"Error handling Extended order book message: {e}")
 
     def handle_extended_order_book_update(self, message):
         """Handle Extended order book updates from WebSocket."""
         try:
-            if isinstance(message, str):
-                message = json.loads(message)
+            if isinstance(message, (str, bytes)):
+                message = json_loads(message)
 
-            self.logger.debug(f"Received Extended order book message: {message}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Received Extended order book message: %s", message)
 
             # Check if this is an order book update message
             if message.get("type") in ["SNAPSHOT", "DELTA"]:
@@ -705,53 +891,18 @@ class HedgeBot:
                         self.extended_order_book['bids'].clear()
                         self.extended_order_book['asks'].clear()
 
-                    # Update bids - Extended format is [{"p": "price", "q": "size"}, ...]
-                    bids = data.get('b', [])
-                    for bid in bids:
-                        if isinstance(bid, dict):
-                            price = Decimal(bid.get('p', '0'))
-                            size = Decimal(bid.get('q', '0'))
-                        else:
-                            # Fallback for array format [price, size]
-                            price = Decimal(bid[0])
-                            size = Decimal(bid[1])
-                        
-                        if size > 0:
-                            self.extended_order_book['bids'][price] = size
-                        else:
-                            # Remove zero size orders
-                            self.extended_order_book['bids'].pop(price, None)
-
-                    # Update asks - Extended format is [{"p": "price", "q": "size"}, ...]
-                    asks = data.get('a', [])
-                    for ask in asks:
-                        if isinstance(ask, dict):
-                            price = Decimal(ask.get('p', '0'))
-                            size = Decimal(ask.get('q', '0'))
-                        else:
-                            # Fallback for array format [price, size]
-                            price = Decimal(ask[0])
-                            size = Decimal(ask[1])
-                        
-                        if size > 0:
-                            self.extended_order_book['asks'][price] = size
-                        else:
-                            # Remove zero size orders
-                            self.extended_order_book['asks'].pop(price, None)
-
-                    # Update best bid and ask
-                    if self.extended_order_book['bids']:
-                        self.extended_best_bid = max(self.extended_order_book['bids'].keys())
-                    if self.extended_order_book['asks']:
-                        self.extended_best_ask = min(self.extended_order_book['asks'].keys())
+                    # Update bids/asks - Extended format is [{"p": "price", "q": "size"}, ...]
+                    self.extended_best_bid = self._apply_extended_levels('bids', data.get('b', []), self.extended_best_bid)
+                    self.extended_best_ask = self._apply_extended_levels('asks', data.get('a', []), self.extended_best_ask)
 
                     if not self.extended_order_book_ready:
                         self.extended_order_book_ready = True
+                        self.extended_order_book_ready_event.set()
                         self.logger.info(f"📊 Extended order book ready - Best bid: {self.extended_best_bid}, "
                                          f"Best ask: {self.extended_best_ask}")
-                    else:
-                        self.logger.debug(f"📊 Order book updated - Best bid: {self.extended_best_bid}, "
-                                          f"Best ask: {self.extended_best_ask}")
+                    elif self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("📊 Order book updated - Best bid: %s, Best ask: %s",
+                                          self.extended_best_bid, self.extended_best_ask)
 
         except Exception as e:
             self.logger.error(f"Error handling Extended order book update: {e}")
@@ -905,8 +1056,8 @@ class HedgeBot:
                 order_id = order_data.get('order_id')
                 status = order_data.get('status')
                 side = order_data.get('side', '').lower()
-                filled_size = Decimal(order_data.get('filled_size', '0'))
-                size = Decimal(order_data.get('size', '0'))
+                filled_size = order_data.get('filled_size', '0')
+                size = order_data.get('size', '0')
                 price = order_data.get('price', '0')
 
                 if side == 'buy':
@@ -916,6 +1067,9 @@ class HedgeBot:
 
                 # Handle the order update
                 if status == 'FILLED':
+                    # Only fills need numeric sizes; other statuses just log the raw values
+                    filled_size = Decimal(filled_size)
+                    size = Decimal(size)
                     if side == 'buy':
                         self.extended_position += filled_size
                     else:
@@ -946,15 +1100,14 @@ class HedgeBot:
                     else:
                         self.logger.info(f"[{order_id}] [{order_type}] [Extended] [{status}]: {filled_size} @ {price}")
                     # Update order status for all non-filled statuses
-                    if status == 'PARTIALLY_FILLED':
-                        self.extended_order_status = "OPEN"
-                    elif status in ['CANCELED', 'CANCELLED']:
-                        self.extended_order_status = status
-                    elif status in ['NEW', 'OPEN', 'PENDING', 'CANCELING']:
-                        self.extended_order_status = status
-                    else:
+                    order_status = self.EXTENDED_ORDER_STATUS_MAP.get(status)
+                    if order_status is None:
                         self.logger.warning(f"Unknown order status: {status}")
-                        self.extended_order_status = status
+                        order_status = status
+                    self.extended_order_status = order_status
+
+                # Wake up the order monitor as soon as the status changes
+                self.extended_order_status_event.set()
 
             except Exception as e:
                 self.logger.error(f"Error handling Extended order update: {e}")
@@ -981,45 +1134,45 @@ class HedgeBot:
 
             async def handle_depth_websocket():
                 """Handle depth WebSocket connection."""
-                # Use the correct Extended WebSocket URL for order book stream
-                market_name = f"{self.ticker}-USD"  # Extended uses format like BTC-USD
-                url = f"wss://api.starknet.extended.exchange/stream.extended.exchange/v1/orderbooks/{market_name}?depth=1"
-
                 while not self.stop_flag:
+                    resubscribe = False
                     try:
-                        async with websockets.connect(url) as ws:
-                            self.logger.info(f"✅ Connected to Extended order book stream for {market_name}")
+                        # Compression off: depth=1 frames are tiny and inflating them only adds CPU per frame
+                        async with websockets.connect(self.extended_depth_ws_url, compression=None,
+                                                      max_size=2 ** 20, max_queue=8) as ws:
+                            self.logger.info(f"✅ Connected to Extended order book stream for {self.extended_market_name}")
 
-                            # Listen for messages
-                            async for message in ws:
-                                if self.stop_flag:
-                                    break
-
-                                try:
-                                    # Handle ping frames
-                                    if isinstance(message, bytes) and message == b'\x09':
-                                        await ws.pong()
-                                        continue
+                            # Hand frames to a separate task so bursts are coalesced instead of applied one by one
+                            depth_queue = asyncio.Queue(maxsize=100)
+                            process_task = asyncio.create_task(self.process_extended_depth_queue(depth_queue))
 
-                                    data = json.loads(message)
-                                    self.logger.debug(f"Received Extended order book message: {data}")
-
-                                    # Handle order book updates
-                                    if data.get("type") in ["SNAPSHOT", "DELTA"]:
-                                        self.handle_extended_order_book_update(data)
+                            try:
+                                # Listen for messages
+                                async for message in ws:
+                                    if self.stop_flag:
+                                        break
 
-                                except json.JSONDecodeError as e:
-                                    self.logger.warning(f"Failed to parse Extended order book message: {e}")
-                                except Exception as e:
-                                    self.logger.error(f"Error handling Extended order book message: {e}")
+                                    if depth_queue.full():
+                                        # The processor fell behind and deltas can't be skipped safely:
+                                        # reconnect so the stream starts over with a fresh snapshot
+                                        self.logger.warning("⚠️ Extended order book queue overflowed, "
+                                                            "resubscribing for a fresh snapshot")
+                                        self.extended_order_book_resync = True
+                                        # Fall back to REST BBO until the book is rebuilt
+                                        self.extended_order_book_ready = False
+                                        resubscribe = True
+                                        break
+                                    depth_queue.put_nowait(message)
+                            finally:
+                                process_task.cancel()
 
                     except websockets.exceptions.ConnectionClosed:
                         self.logger.warning("Extended order book WebSocket connection closed, reconnecting...")
                     except Exception as e:
                         self.logger.error(f"Extended order book WebSocket error: {e}")
 
-                    # Wait before reconnecting
-                    if not self.stop_flag:
+                    # Wait before reconnecting (a resubscribe after queue overflow reconnects immediately)
+                    if not self.stop_flag and not resubscribe:
                         await asyncio.sleep(2)
 
             # Start depth WebSocket in background
@@ -1029,9 +1182,19 @@ class HedgeBot:
         except Exception as e:
             self.logger.error(f"Could not setup Extended order book WebSocket: {e}")
 
+    async def wait_for_event_or_stop(self, event: asyncio.Event, timeout: float) -> bool:
+        """Wait until event is set, the bot is stopped, or timeout expires. Returns whether event is set."""
+        event_task = asyncio.create_task(event.wait())
+        stop_task = asyncio.create_task(self.stop_event.wait())
+        _, pending = await asyncio.wait({event_task, stop_task}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        return event.is_set()
+
     async def trading_loop(self):
         """Main trading loop implementing the new strategy."""
         self.logger.info(f"🚀 Starting hedge bot for {self.ticker}")
+        self.csv_writer_task = asyncio.create_task(self.csv_writer())
 
         # Initialize clients
         try:
@@ -1057,12 +1220,8 @@ class HedgeBot:
             # Wait for initial order book data with timeout
             self.logger.info("⏳ Waiting for initial order book data...")
             timeout = 10  # seconds
-            start_time = time.time()
-            while not self.extended_order_book_ready and not self.stop_flag:
-                if time.time() - start_time > timeout:
-                    self.logger.warning(f"⚠️ Timeout waiting for WebSocket order book data after {timeout}s")
-                    break
-                await asyncio.sleep(0.5)
+            if not await self.wait_for_event_or_stop(self.extended_order_book_ready_event, timeout) and not self.stop_flag:
+                self.logger.warning(f"⚠️ Timeout waiting for WebSocket order book data after {timeout}s")
 
             if self.extended_order_book_ready:
                 self.logger.info("✅ WebSocket order book data received")
@@ -1081,12 +1240,8 @@ class HedgeBot:
             # Wait for initial Lighter order book data with timeout
             self.logger.info("⏳ Waiting for initial Lighter order book data...")
             timeout = 10  # seconds
-            start_time = time.time()
-            while not self.lighter_order_book_ready and not self.stop_flag:
-                if time.time() - start_time > timeout:
-                    self.logger.warning(f"⚠️ Timeout waiting for Lighter WebSocket order book data after {timeout}s")
-                    break
-                await asyncio.sleep(0.5)
+            if not await self.wait_for_event_or_stop(self.lighter_order_book_ready_event, timeout) and not self.stop_flag:
+                self.logger.warning(f"⚠️ Timeout waiting for Lighter WebSocket order book data after {timeout}s")
 
             if self.lighter_order_book_ready:
                 self.logger.info("✅ Lighter WebSocket order book data received")
@@ -1097,6 +1252,9 @@ class HedgeBot:
             self.logger.error(f"❌ Failed to setup Lighter websocket: {e}")
             return
 
+        if self.stop_flag:
+            return
+
         await asyncio.sleep(5)
 
         iterations = 0
@@ -1145,7 +1303,12 @@ class HedgeBot:
             # Sleep after step 1
             if self.sleep_time > 0:
                 self.logger.info(f"💤 Sleeping {self.sleep_time} seconds after STEP 1...")
-                await asyncio.sleep(self.sleep_time)
+                try:
+                    await asyncio.wait_for(self.stop_event.wait(), timeout=self.sleep_time)
+                except asyncio.TimeoutError:
+                    pass
+                if self.stop_flag:
+                    break
 
             # Close position
             self.logger.info(f"[STEP 2] Extended position: {self.extended_position} | Lighter position: {self.lighter_position}")
@@ -1220,6 +1383,17 @@ class HedgeBot:
             self.logger.info("\n🛑 Received interrupt signal...")
         finally:
             self.logger.info("🔄 Cleaning up...")
+            if self.pending_cancel_tasks:
+                # Give in-flight cancels a bounded time to finish so shutdown can't hang on REST retries
+                _, pending = await asyncio.wait(list(self.pending_cancel_tasks.values()), timeout=5)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    self.logger.warning(f"⚠️ {len(pending)} Extended cancel request(s) still pending at shutdown, abandoned")
+                    await asyncio.gather(*pending, return_exceptions=True)
+            if self.extended_client:
+                await self.extended_client.close_http_session()
+            await self.stop_csv_writer()
             self.shutdown()
 
 
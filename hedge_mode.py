@@ -108,9 +108,8 @@ def get_hedge_bot_class(exchange, v2=False):
         sys.exit(1)
 
 
-async def main():
+async def main(args):
     """Main entry point that creates and runs the appropriate hedge bot."""
-    args = parse_arguments()
 
     env_path = Path(args.env_file)
     if not env_path.exists():
@@ -180,5 +179,29 @@ async def main():
     return 0
 
 
+def get_uvloop(exchange: str):
+    """Return the uvloop module if it should drive this exchange's hedge bot, otherwise None.
+
+    Only the Extended bot has been run under uvloop; the other bots keep the default event loop.
+    uvloop is optional (and unavailable on Windows), so None is returned when it is not installed.
+    """
+    if exchange.lower() != 'extended':
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop
+
+
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
\ No newline at end of file
+    args = parse_arguments()
+    uvloop = get_uvloop(args.exchange)
+
+    if uvloop is None:
+        sys.exit(asyncio.run(main(args)))
+    elif sys.version_info >= (3, 12):
+        sys.exit(asyncio.run(main(args), loop_factory=uvloop.new_event_loop))
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        sys.exit(asyncio.run(main(args)))
\ No newline at end of file